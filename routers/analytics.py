@@ -4,7 +4,8 @@ from sqlalchemy import func, desc
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 
-from database import get_db
+from database import get_db, SessionLocal
+from singleflight import SingleFlight
 from models import (
     Meeting, 
     MeetingAnalytics, 
@@ -18,13 +19,27 @@ from schemas import (
     WorkforceMetrics as WorkforceMetricsSchema,
     WorkforceMetricsCreate,
     AnalyticsResponse,
-    DashboardData
+    DashboardData,
+    CoalescingStats
 )
 
 router = APIRouter()
 
+# Shared by the read-heavy dashboard endpoints so that a burst of identical
+# requests runs the query set once
+analytics_flight = SingleFlight()
+
+def _in_own_session(compute, *args):
+    # The shared computation outlives the request that started it, so it
+    # can't borrow that request's session
+    with SessionLocal() as db:
+        return compute(db, *args)
+
 @router.get("/dashboard", response_model=DashboardData)
-async def get_dashboard_data(db: Session = Depends(get_db)):
+async def get_dashboard_data():
+    return await analytics_flight.do(("dashboard",), _in_own_session, _compute_dashboard_data)
+
+def _compute_dashboard_data(db: Session) -> DashboardData:
     try:
         # Get recent meetings
         recent_meetings = db.query(Meeting).order_by(desc(Meeting.created_at)).limit(5).all()
@@ -154,7 +169,12 @@ async def update_meeting_analytics(
     return analytics
 
 @router.get("/sentiment/trends")
-async def get_sentiment_trends(days: int = 30, db: Session = Depends(get_db)):
+async def get_sentiment_trends(days: int = 30):
+    return await analytics_flight.do(
+        ("sentiment_trends", days), _in_own_session, _compute_sentiment_trends, days
+    )
+
+def _compute_sentiment_trends(db: Session, days: int) -> List[Dict[str, Any]]:
     start_date = datetime.utcnow() - timedelta(days=days)
     
     trends = db.query(
@@ -201,7 +221,10 @@ async def create_workforce_metric(metric: WorkforceMetricsCreate, db: Session =
     return db_metric
 
 @router.get("/summary")
-async def get_analytics_summary(db: Session = Depends(get_db)):
+async def get_analytics_summary():
+    return await analytics_flight.do(("summary",), _in_own_session, _compute_analytics_summary)
+
+def _compute_analytics_summary(db: Session) -> Dict[str, Any]:
     # Overall statistics
     total_meetings = db.query(Meeting).count()
     total_participants = db.query(Participant).count()
@@ -242,4 +265,8 @@ async def get_analytics_summary(db: Session = Depends(get_db)):
             }
             for dept in dept_metrics
         ]
-    }
\ No newline at end of file
+    }
+
+@router.get("/coalescing/stats", response_model=CoalescingStats)
+async def get_coalescing_stats():
+    return analytics_flight.stats()
\ No newline at end of file
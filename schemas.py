@@ -122,4 +122,9 @@ class DashboardData(BaseModel):
     recent_meetings: List[Meeting]
     analytics_summary: Dict[str, Any]
     sentiment_trends: List[Dict[str, Any]]
-    workforce_insights: List[Dict[str, Any]]
\ No newline at end of file
+    workforce_insights: List[Dict[str, Any]]
+
+class CoalescingStats(BaseModel):
+    executed: int
+    coalesced: int
+    in_flight: int
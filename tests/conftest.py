@@ -0,0 +1,7 @@
+import os
+import sys
+
+# database.py builds its engine at import time from DATABASE_URL
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from routers import analytics
+from singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        release.wait(timeout=5)
+        return value * 2
+
+    async def run():
+        callers = [asyncio.ensure_future(flight.do("key", compute, 21)) for _ in range(10)]
+        while not calls:
+            await asyncio.sleep(0.01)
+        release.set()
+        return await asyncio.gather(*callers)
+
+    results = asyncio.run(run())
+
+    assert results == [42] * 10
+    assert calls == [21]
+    assert flight.stats() == {"executed": 1, "coalesced": 9, "in_flight": 0}
+
+
+def test_different_keys_are_not_coalesced():
+    flight = SingleFlight()
+
+    async def run():
+        return await asyncio.gather(
+            flight.do(("trends", 7), lambda: 7),
+            flight.do(("trends", 30), lambda: 30)
+        )
+
+    assert asyncio.run(run()) == [7, 30]
+    assert flight.stats()["executed"] == 2
+    assert flight.stats()["coalesced"] == 0
+
+
+def test_errors_reach_every_caller():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def compute():
+        release.wait(timeout=5)
+        raise ValueError("boom")
+
+    async def run():
+        callers = [asyncio.ensure_future(flight.do("key", compute)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*callers, return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_concurrent_summary_requests_run_one_query_set(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(analytics, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(analytics, "analytics_flight", SingleFlight())
+
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_queries(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+        # Keep the computation in flight long enough for every request to join
+        time.sleep(0.02)
+
+    # Baseline: how many queries a single summary request issues
+    with analytics.SessionLocal() as db:
+        analytics._compute_analytics_summary(db)
+    queries_per_summary = len(statements)
+    assert queries_per_summary > 0
+    statements.clear()
+
+    app = FastAPI()
+    app.include_router(analytics.router, prefix="/api/analytics")
+    n = 10
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(
+                *[client.get("/api/analytics/summary") for _ in range(n)]
+            )
+
+    responses = asyncio.run(run())
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len({response.text for response in responses}) == 1
+    assert len(statements) == queries_per_summary
+    assert analytics.analytics_flight.stats() == {
+        "executed": 1,
+        "coalesced": n - 1,
+        "in_flight": 0
+    }